@@ -9,13 +9,13 @@ from typing import Any, cast
 from ring_doorbell import Auth, Ring, RingDevices
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import APPLICATION_NAME, CONF_TOKEN, __version__
+from homeassistant.const import CONF_TOKEN
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, PLATFORMS, USER_AGENT
 from .coordinator import RingDataCoordinator, RingNotificationsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,13 +36,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     def token_updater(token: dict[str, Any]) -> None:
         """Handle from async context when token is updated."""
-        hass.config_entries.async_update_entry(
-            entry,
-            data={**entry.data, CONF_TOKEN: token},
-        )
+        data = dict(entry.data)
+        data[CONF_TOKEN] = token
+        hass.config_entries.async_update_entry(entry, data=data)
 
     auth = Auth(
-        f"{APPLICATION_NAME}/{__version__}",
+        USER_AGENT,
         entry.data[CONF_TOKEN],
         token_updater,
         http_client_session=async_get_clientsession(hass),
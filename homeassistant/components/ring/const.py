@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 
-from homeassistant.const import Platform
+from homeassistant.const import APPLICATION_NAME, Platform, __version__
 
 ATTRIBUTION = "Data provided by Ring.com"
 
@@ -14,6 +14,8 @@ NOTIFICATION_TITLE = "Ring Setup"
 DOMAIN = "ring"
 DEFAULT_ENTITY_NAMESPACE = "ring"
 
+USER_AGENT = f"{APPLICATION_NAME}/{__version__}"
+
 PLATFORMS = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 import logging
 from typing import Any
@@ -49,6 +49,7 @@ from .const import (
     CONNECT_TIMEOUT,
     DISCOVERY_TIMEOUT,
     DOMAIN,
+    MAX_CONCURRENT_DISCOVERIES,
     PLATFORMS,
 )
 from .coordinator import TPLinkDataUpdateCoordinator
@@ -59,6 +60,10 @@ type TPLinkConfigEntry = ConfigEntry[TPLinkData]
 DISCOVERY_INTERVAL = timedelta(minutes=15)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Key for the result of the last discovery and how long it can be reused
+_DISCOVERED_DEVICES = "discovered_devices"
+_DISCOVERED_DEVICES_MAX_AGE = 60
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -73,10 +78,18 @@ def create_async_tplink_clientsession(hass: HomeAssistant) -> ClientSession:
 def async_trigger_discovery(
     hass: HomeAssistant,
     discovered_devices: dict[str, Device],
+    device_configs: dict[str, dict[str, Any]],
 ) -> None:
     """Trigger config flows for discovered devices."""
 
+    # A flow for a loaded entry that is still at the same host would only abort
+    loaded_hosts = {
+        entry.unique_id: entry.data[CONF_HOST]
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    }
     for formatted_mac, device in discovered_devices.items():
+        if loaded_hosts.get(formatted_mac) == device.host:
+            continue
         discovery_flow.async_create_flow(
             hass,
             DOMAIN,
@@ -85,41 +98,99 @@ def async_trigger_discovery(
                 CONF_ALIAS: device.alias or mac_alias(device.mac),
                 CONF_HOST: device.host,
                 CONF_MAC: formatted_mac,
-                CONF_DEVICE_CONFIG: device.config.to_dict(
-                    exclude_credentials=True,
-                ),
+                CONF_DEVICE_CONFIG: device_configs[formatted_mac],
             },
         )
 
 
-async def async_discover_devices(hass: HomeAssistant) -> dict[str, Device]:
-    """Discover TPLink devices on configured network interfaces."""
+async def async_discover_devices(
+    hass: HomeAssistant,
+    discovered_callback: Callable[
+        [HomeAssistant, dict[str, Device], dict[str, dict[str, Any]]], None
+    ]
+    | None = None,
+) -> dict[str, Device]:
+    """Discover TPLink devices on configured network interfaces.
+
+    If discovered_callback is set it is called with the devices found on each
+    interface, and their device config dicts, as soon as that interface
+    finishes, so slow interfaces do not hold back devices that were already
+    found.
+    """
 
     credentials = await get_credentials(hass)
     broadcast_addresses = await network.async_get_ipv4_broadcast_addresses(hass)
-    tasks = [
-        Discover.discover(
-            target=str(address),
-            discovery_timeout=DISCOVERY_TIMEOUT,
-            timeout=CONNECT_TIMEOUT,
-            credentials=credentials,
-        )
-        for address in broadcast_addresses
-    ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DISCOVERIES)
+
+    async def _async_discover(target: str) -> dict[str, Device]:
+        async with semaphore:
+            return await Discover.discover(
+                target=target,
+                discovery_timeout=DISCOVERY_TIMEOUT,
+                timeout=CONNECT_TIMEOUT,
+                credentials=credentials,
+            )
+
+    tasks = [_async_discover(str(address)) for address in broadcast_addresses]
     discovered_devices: dict[str, Device] = {}
-    for device_list in await asyncio.gather(*tasks):
-        for device in device_list.values():
-            discovered_devices[dr.format_mac(device.mac)] = device
+    # Only keep what setup needs so the devices and their transports can be freed
+    discovered_configs: dict[str, tuple[str, dict[str, Any]]] = {}
+    for next_device_list in asyncio.as_completed(tasks):
+        devices = {
+            dr.format_mac(device.mac): device
+            for device in (await next_device_list).values()
+        }
+        # Serialize each config once for both the discovery flows and the cache
+        device_configs = {
+            formatted_mac: device.config.to_dict(exclude_credentials=True)
+            for formatted_mac, device in devices.items()
+        }
+        if devices and discovered_callback:
+            discovered_callback(hass, devices, device_configs)
+        discovered_devices.update(devices)
+        discovered_configs.update(
+            (formatted_mac, (device.host, device_configs[formatted_mac]))
+            for formatted_mac, device in devices.items()
+        )
+    hass.data.setdefault(DOMAIN, {})[_DISCOVERED_DEVICES] = (
+        hass.loop.time(),
+        discovered_configs,
+    )
     return discovered_devices
 
 
+@callback
+def _async_get_recently_discovered_config(
+    hass: HomeAssistant, formatted_mac: str | None, host: str
+) -> dict[str, Any] | None:
+    """Return the device config dict if a recent discovery found it at host."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if not (discovered := domain_data.get(_DISCOVERED_DEVICES)):
+        return None
+    discovered_at, discovered_configs = discovered
+    if hass.loop.time() - discovered_at > _DISCOVERED_DEVICES_MAX_AGE:
+        del domain_data[_DISCOVERED_DEVICES]
+        return None
+    if (
+        formatted_mac
+        and (discovered_config := discovered_configs.get(formatted_mac))
+        and discovered_config[0] == host
+    ):
+        return discovered_config[1]
+    return None
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the TP-Link component."""
     hass.data.setdefault(DOMAIN, {})
+    discovery_lock = asyncio.Lock()
 
     async def _async_discovery(*_: Any) -> None:
-        if discovered := await async_discover_devices(hass):
-            async_trigger_discovery(hass, discovered)
+        # A slow discovery can still be running when the next one is due
+        if discovery_lock.locked():
+            return
+        async with discovery_lock:
+            await async_discover_devices(hass, async_trigger_discovery)
 
     hass.async_create_background_task(
         _async_discovery(), "tplink first discovery", eager_start=True
@@ -146,6 +217,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: TPLinkConfigEntry) -> bo
                 "Invalid connection type dict for %s: %s", host, config_dict
             )
 
+    if not config and (
+        discovered_config := _async_get_recently_discovered_config(
+            hass, entry.unique_id, host
+        )
+    ):
+        # Reuse the connection details from discovery so connect does not
+        # have to fall back to the legacy protocol.
+        config = DeviceConfig.from_dict(discovered_config)
+
     if not config:
         config = DeviceConfig(host)
     else:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from functools import partial
 import logging
 from typing import Any
 
@@ -55,6 +57,7 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema({vol.Optional(CONF_HOST, default=""): str})
 STEP_AUTH_DATA_SCHEMA = vol.Schema(
     {vol.Required(CONF_USERNAME): str, vol.Required(CONF_PASSWORD): str}
 )
@@ -154,9 +157,8 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
         self._async_abort_entries_match({CONF_HOST: host})
         self.context[CONF_HOST] = host
-        for progress in self._async_in_progress():
-            if progress.get("context", {}).get(CONF_HOST) == host:
-                return self.async_abort(reason="already_in_progress")
+        if self._async_in_progress(match_context={CONF_HOST: host}):
+            return self.async_abort(reason="already_in_progress")
         credentials = await get_credentials(self.hass)
         try:
             await self._async_try_discover_and_update(
@@ -174,7 +176,7 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Dialog that informs the user that auth is required."""
         assert self._discovered_device is not None
-        errors = {}
+        errors: dict[str, str] = {}
 
         credentials = await get_credentials(self.hass)
         if credentials and credentials != self._discovered_device.config.credentials:
@@ -190,27 +192,15 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
 
         placeholders = self._async_make_placeholders_from_discovery()
 
-        if user_input:
-            username = user_input[CONF_USERNAME]
-            password = user_input[CONF_PASSWORD]
-            credentials = Credentials(username, password)
-            try:
-                device = await self._async_try_connect(
-                    self._discovered_device, credentials
-                )
-            except AuthenticationError as ex:
-                errors[CONF_PASSWORD] = "invalid_auth"
-                placeholders["error"] = str(ex)
-            except KasaException as ex:
-                errors["base"] = "cannot_connect"
-                placeholders["error"] = str(ex)
-            else:
-                self._discovered_device = device
-                await set_credentials(self.hass, username, password)
-                self.hass.async_create_task(
-                    self._async_reload_requires_auth_entries(), eager_start=False
-                )
-                return self._async_create_entry_from_device(self._discovered_device)
+        if user_input and (
+            authenticated_device := await self._async_try_connect_with_user_input(
+                user_input,
+                partial(self._async_try_connect, self._discovered_device),
+                errors,
+                placeholders,
+            )
+        ):
+            return self._async_create_entry_from_device(authenticated_device)
 
         self.context["title_placeholders"] = placeholders
         return self.async_show_form(
@@ -272,7 +262,7 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({vol.Optional(CONF_HOST, default=""): str}),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
             description_placeholders=placeholders,
         )
@@ -286,26 +276,15 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
         placeholders: dict[str, str] = {CONF_HOST: host}
 
         assert self._discovered_device is not None
-        if user_input:
-            username = user_input[CONF_USERNAME]
-            password = user_input[CONF_PASSWORD]
-            credentials = Credentials(username, password)
-            try:
-                device = await self._async_try_connect(
-                    self._discovered_device, credentials
-                )
-            except AuthenticationError as ex:
-                errors[CONF_PASSWORD] = "invalid_auth"
-                placeholders["error"] = str(ex)
-            except KasaException as ex:
-                errors["base"] = "cannot_connect"
-                placeholders["error"] = str(ex)
-            else:
-                await set_credentials(self.hass, username, password)
-                self.hass.async_create_task(
-                    self._async_reload_requires_auth_entries(), eager_start=False
-                )
-                return self._async_create_entry_from_device(device)
+        if user_input and (
+            device := await self._async_try_connect_with_user_input(
+                user_input,
+                partial(self._async_try_connect, self._discovered_device),
+                errors,
+                placeholders,
+            )
+        ):
+            return self._async_create_entry_from_device(device)
 
         return self.async_show_form(
             step_id="user_auth_confirm",
@@ -324,6 +303,7 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
             self._discovered_device = self._discovered_devices[mac]
             host = self._discovered_device.host
 
+            self._async_abort_entries_match({CONF_HOST: host})
             self.context[CONF_HOST] = host
             credentials = await get_credentials(self.hass)
 
@@ -337,9 +317,9 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="cannot_connect")
             return self._async_create_entry_from_device(device)
 
-        configured_devices = {
+        configured_devices = frozenset(
             entry.unique_id for entry in self._async_current_entries()
-        }
+        )
         self._discovered_devices = await async_discover_devices(self.hass)
         devices_name = {
             formatted_mac: (
@@ -360,20 +340,31 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
         """Reload any in progress config flow that now have credentials."""
         _config_entries = self.hass.config_entries
 
+        entry_ids: set[str] = set()
         if reauth_entry := self.reauth_entry:
-            await _config_entries.async_reload(reauth_entry.entry_id)
+            entry_ids.add(reauth_entry.entry_id)
 
+        reauth_flows: list[tuple[ConfigEntry, str]] = []
         for flow in _config_entries.flow.async_progress_by_handler(
-            DOMAIN, include_uninitialized=True
+            DOMAIN, include_uninitialized=True, match_context={"source": SOURCE_REAUTH}
         ):
-            context: dict[str, Any] = flow["context"]
-            if context.get("source") != SOURCE_REAUTH:
-                continue
-            entry_id: str = context["entry_id"]
+            entry_id: str = flow["context"]["entry_id"]
             if entry := _config_entries.async_get_entry(entry_id):
-                await _config_entries.async_reload(entry.entry_id)
-                if entry.state is ConfigEntryState.LOADED:
-                    _config_entries.flow.async_abort(flow["flow_id"])
+                entry_ids.add(entry_id)
+                reauth_flows.append((entry, flow["flow_id"]))
+
+        # Each entry is a separate device so they do not need to wait on each other
+        reload_entry_ids = list(entry_ids)
+        results = await asyncio.gather(
+            *(_config_entries.async_reload(entry_id) for entry_id in reload_entry_ids),
+            return_exceptions=True,
+        )
+        for entry_id, result in zip(reload_entry_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Unable to reload entry %s: %s", entry_id, result)
+        for entry, flow_id in reauth_flows:
+            if entry.state is ConfigEntryState.LOADED:
+                _config_entries.flow.async_abort(flow_id)
 
     @callback
     def _async_create_entry_from_device(self, device: Device) -> ConfigFlowResult:
@@ -434,14 +425,42 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
         )
         return self._discovered_device
 
+    async def _async_try_connect_with_user_input(
+        self,
+        user_input: dict[str, Any],
+        connect: Callable[[Credentials], Awaitable[Device]],
+        errors: dict[str, str],
+        placeholders: dict[str, str],
+    ) -> Device | None:
+        """Try to connect with the credentials entered by the user.
+
+        On success the credentials are stored and entries waiting on them are
+        reloaded, otherwise errors and placeholders are updated.
+        """
+        username = user_input[CONF_USERNAME]
+        password = user_input[CONF_PASSWORD]
+        try:
+            device = await connect(Credentials(username, password))
+        except AuthenticationError as ex:
+            errors[CONF_PASSWORD] = "invalid_auth"
+            placeholders["error"] = str(ex)
+        except KasaException as ex:
+            errors["base"] = "cannot_connect"
+            placeholders["error"] = str(ex)
+        else:
+            await set_credentials(self.hass, username, password)
+            self.hass.async_create_task(
+                self._async_reload_requires_auth_entries(), eager_start=False
+            )
+            return device
+        return None
+
     async def _async_try_connect(
         self,
         discovered_device: Device,
         credentials: Credentials | None,
     ) -> Device:
         """Try to connect."""
-        self._async_abort_entries_match({CONF_HOST: discovered_device.host})
-
         config = discovered_device.config
         if credentials:
             config.credentials = credentials
@@ -476,33 +495,20 @@ class TPLinkConfigFlow(ConfigFlow, domain=DOMAIN):
         entry_data = reauth_entry.data
         host = entry_data[CONF_HOST]
 
-        if user_input:
-            username = user_input[CONF_USERNAME]
-            password = user_input[CONF_PASSWORD]
-            credentials = Credentials(username, password)
-            try:
-                device = await self._async_try_discover_and_update(
-                    host,
-                    credentials=credentials,
-                    raise_on_progress=True,
-                )
-            except AuthenticationError as ex:
-                errors[CONF_PASSWORD] = "invalid_auth"
-                placeholders["error"] = str(ex)
-            except KasaException as ex:
-                errors["base"] = "cannot_connect"
-                placeholders["error"] = str(ex)
-            else:
-                await set_credentials(self.hass, username, password)
-                config = device.config.to_dict(exclude_credentials=True)
-                if updates := self._get_config_updates(reauth_entry, host, config):
-                    self.hass.config_entries.async_update_entry(
-                        reauth_entry, data=updates
-                    )
-                self.hass.async_create_task(
-                    self._async_reload_requires_auth_entries(), eager_start=False
-                )
-                return self.async_abort(reason="reauth_successful")
+        if user_input and (
+            device := await self._async_try_connect_with_user_input(
+                user_input,
+                partial(
+                    self._async_try_discover_and_update, host, raise_on_progress=True
+                ),
+                errors,
+                placeholders,
+            )
+        ):
+            config = device.config.to_dict(exclude_credentials=True)
+            if updates := self._get_config_updates(reauth_entry, host, config):
+                self.hass.config_entries.async_update_entry(reauth_entry, data=updates)
+            return self.async_abort(reason="reauth_successful")
 
         # Old config entries will not have these values.
         alias = entry_data.get(CONF_ALIAS) or "unknown"
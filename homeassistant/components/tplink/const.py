@@ -9,6 +9,8 @@ from homeassistant.const import Platform, UnitOfTemperature
 DOMAIN = "tplink"
 
 DISCOVERY_TIMEOUT = 5  # Home Assistant will complain if startup takes > 10s
+# Limit simultaneous broadcasts on hosts with many network interfaces
+MAX_CONCURRENT_DISCOVERIES = 4
 CONNECT_TIMEOUT = 5
 
 # Identifier used for primary control state.
@@ -21,7 +21,11 @@ from homeassistant.components.tplink.const import (
     CONF_CREDENTIALS_HASH,
     CONF_DEVICE_CONFIG,
 )
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.config_entries import (
+    SOURCE_REAUTH,
+    ConfigEntryState,
+    OperationNotAllowed,
+)
 from homeassistant.const import (
     CONF_ALIAS,
     CONF_DEVICE,
@@ -1372,3 +1376,67 @@ async def test_reauth_update_other_flows(
     await hass.async_block_till_done()
     flows = hass.config_entries.flow.async_progress()
     assert len(flows) == 0
+
+
+async def test_reauth_update_other_flows_reload_error(
+    hass: HomeAssistant,
+    mock_discovery: AsyncMock,
+    mock_connect: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test reauth still aborts other reauth flows if one entry fails to reload."""
+    mock_config_entry = MockConfigEntry(
+        title="TPLink",
+        domain=DOMAIN,
+        data={**CREATE_ENTRY_DATA_KLAP},
+        unique_id=MAC_ADDRESS,
+    )
+    mock_config_entry2 = MockConfigEntry(
+        title="TPLink",
+        domain=DOMAIN,
+        data={**CREATE_ENTRY_DATA_AES},
+        unique_id=MAC_ADDRESS2,
+    )
+    default_side_effect = mock_connect["connect"].side_effect
+    mock_connect["connect"].side_effect = AuthenticationError()
+    mock_config_entry.add_to_hass(hass)
+    mock_config_entry2.add_to_hass(hass)
+    with patch("homeassistant.components.tplink.Discover.discover", return_value={}):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry2.state is ConfigEntryState.SETUP_ERROR
+    assert mock_config_entry.state is ConfigEntryState.SETUP_ERROR
+    mock_connect["connect"].side_effect = default_side_effect
+
+    flows = hass.config_entries.flow.async_progress()
+    assert len(flows) == 2
+    flows_by_entry_id = {flow["context"]["entry_id"]: flow for flow in flows}
+    result = flows_by_entry_id[mock_config_entry.entry_id]
+
+    async_reload = hass.config_entries.async_reload
+
+    async def _async_reload(entry_id: str) -> bool:
+        if entry_id == mock_config_entry.entry_id:
+            raise OperationNotAllowed("Reload not allowed")
+        return await async_reload(entry_id)
+
+    with patch.object(hass.config_entries, "async_reload", side_effect=_async_reload):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_USERNAME: "fake_username",
+                CONF_PASSWORD: "fake_password",
+            },
+        )
+        assert result2["type"] is FlowResultType.ABORT
+        assert result2["reason"] == "reauth_successful"
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.SETUP_ERROR
+    assert mock_config_entry2.state is ConfigEntryState.LOADED
+    assert len(hass.config_entries.flow.async_progress()) == 0
+    assert (
+        f"Unable to reload entry {mock_config_entry.entry_id}: Reload not allowed"
+        in caplog.text
+    )
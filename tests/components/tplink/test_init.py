@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import copy
 from datetime import timedelta
+from ipaddress import IPv4Address
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -16,6 +18,7 @@ from homeassistant.components.tplink.const import (
     CONF_CREDENTIALS_HASH,
     CONF_DEVICE_CONFIG,
     DOMAIN,
+    MAX_CONCURRENT_DISCOVERIES,
 )
 from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
 from homeassistant.const import (
@@ -39,6 +42,7 @@ from . import (
     DEVICE_ID,
     DEVICE_ID_MAC,
     IP_ADDRESS,
+    IP_ADDRESS2,
     MAC_ADDRESS,
     _mocked_device,
     _patch_connect,
@@ -75,6 +79,135 @@ async def test_configuring_tplink_causes_discovery(
         assert len(discover.mock_calls) == call_count * 3
 
 
+async def test_discovery_skipped_while_in_progress(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a discovery is not started while the previous one is running."""
+    discovery_done = asyncio.Event()
+
+    async def _discover(*args, **kwargs):
+        await discovery_done.wait()
+        return {}
+
+    with patch(
+        "homeassistant.components.tplink.Discover.discover", side_effect=_discover
+    ) as discover:
+        await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+        await hass.async_block_till_done()
+        call_count = len(discover.mock_calls)
+        assert discover.mock_calls
+
+        freezer.tick(tplink.DISCOVERY_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert len(discover.mock_calls) == call_count
+
+        discovery_done.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        freezer.tick(tplink.DISCOVERY_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert len(discover.mock_calls) == call_count * 2
+
+
+async def test_discovery_triggers_flows_per_interface(hass: HomeAssistant) -> None:
+    """Test devices on a fast interface are not held back by a slow interface."""
+    slow_discovery_done = asyncio.Event()
+
+    async def _discover(*args, target, **kwargs):
+        if target == "192.168.2.255":
+            await slow_discovery_done.wait()
+            return {}
+        return {IP_ADDRESS: _mocked_device()}
+
+    with (
+        patch(
+            "homeassistant.components.network.async_get_ipv4_broadcast_addresses",
+            return_value=[IPv4Address("192.168.1.255"), IPv4Address("192.168.2.255")],
+        ),
+        patch(
+            "homeassistant.components.tplink.Discover.discover", side_effect=_discover
+        ),
+        patch(
+            "homeassistant.components.tplink.discovery_flow.async_create_flow"
+        ) as mock_create_flow,
+    ):
+        await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+        await hass.async_block_till_done()
+        assert len(mock_create_flow.mock_calls) == 1
+
+        slow_discovery_done.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert len(mock_create_flow.mock_calls) == 1
+
+
+async def test_discovery_skips_loaded_entries_at_same_host(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test discovery only starts flows for devices that are new or have moved."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: IP_ADDRESS}, unique_id=MAC_ADDRESS
+    )
+    entry.add_to_hass(hass)
+    with _patch_discovery(), _patch_single_discovery(), _patch_connect():
+        await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert entry.state is ConfigEntryState.LOADED
+
+    discovered_device = _mocked_device()
+    with (
+        patch(
+            "homeassistant.components.tplink.Discover.discover",
+            return_value={IP_ADDRESS: discovered_device},
+        ),
+        patch(
+            "homeassistant.components.tplink.discovery_flow.async_create_flow"
+        ) as mock_create_flow,
+    ):
+        freezer.tick(tplink.DISCOVERY_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert not mock_create_flow.mock_calls
+
+        discovered_device.host = IP_ADDRESS2
+        freezer.tick(tplink.DISCOVERY_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert mock_create_flow.mock_calls
+
+
+async def test_discovery_concurrency_is_limited(hass: HomeAssistant) -> None:
+    """Test only a limited number of interfaces are discovered at once."""
+    active = max_active = 0
+
+    async def _discover(*args, **kwargs):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return {}
+
+    broadcast_addresses = [
+        IPv4Address(f"192.168.{subnet}.255")
+        for subnet in range(MAX_CONCURRENT_DISCOVERIES + 2)
+    ]
+    with (
+        patch(
+            "homeassistant.components.network.async_get_ipv4_broadcast_addresses",
+            return_value=broadcast_addresses,
+        ),
+        patch(
+            "homeassistant.components.tplink.Discover.discover", side_effect=_discover
+        ) as discover,
+    ):
+        assert await tplink.async_discover_devices(hass) == {}
+
+    assert len(discover.mock_calls) == len(broadcast_addresses)
+    assert max_active == MAX_CONCURRENT_DISCOVERIES
+
+
 async def test_config_entry_reload(hass: HomeAssistant) -> None:
     """Test that a config entry can be reloaded."""
     already_migrated_config_entry = MockConfigEntry(
@@ -715,3 +848,75 @@ async def test_credentials_hash_auth_error(
     connect_mock.assert_called_with(config=expected_config)
     assert entry.state is ConfigEntryState.SETUP_ERROR
     assert CONF_CREDENTIALS_HASH not in entry.data
+
+
+async def test_config_entry_uses_recent_discovery(
+    hass: HomeAssistant,
+    mock_discovery: AsyncMock,
+    mock_connect: AsyncMock,
+) -> None:
+    """Test an entry without a device config reuses a recent discovery result."""
+    await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert mock_discovery["discover"].mock_calls
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: IP_ADDRESS}, unique_id=MAC_ADDRESS
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+
+    config = mock_connect["connect"].call_args.kwargs["config"]
+    assert config.connection_type == DEVICE_CONFIG_KLAP.connection_type
+
+
+async def test_config_entry_ignores_stale_discovery(
+    hass: HomeAssistant,
+    mock_discovery: AsyncMock,
+    mock_connect: AsyncMock,
+) -> None:
+    """Test an old discovery result is dropped instead of reused."""
+    await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    domain_data = hass.data[DOMAIN]
+    _, discovered_configs = domain_data[tplink._DISCOVERED_DEVICES]
+    domain_data[tplink._DISCOVERED_DEVICES] = (
+        hass.loop.time() - tplink._DISCOVERED_DEVICES_MAX_AGE - 1,
+        discovered_configs,
+    )
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: IP_ADDRESS}, unique_id=MAC_ADDRESS
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    config = mock_connect["connect"].call_args.kwargs["config"]
+    assert config.connection_type == DeviceConfig(IP_ADDRESS).connection_type
+    assert tplink._DISCOVERED_DEVICES not in domain_data
+
+
+async def test_config_entry_ignores_discovery_at_other_host(
+    hass: HomeAssistant,
+    mock_discovery: AsyncMock,
+    mock_connect: AsyncMock,
+) -> None:
+    """Test a discovery result is not reused if the device was found elsewhere."""
+    await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert mock_discovery["discover"].mock_calls
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: IP_ADDRESS2}, unique_id=MAC_ADDRESS
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    config = mock_connect["connect"].call_args.kwargs["config"]
+    assert config.host == IP_ADDRESS2
+    assert config.connection_type == DeviceConfig(IP_ADDRESS2).connection_type